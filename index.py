@@ -1,28 +1,152 @@
 import datetime
+import functools
 import glob
+import hashlib
 import mimetypes
 import os
-from typing import Any, Union
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import PurePath
+from typing import Any, Optional, Union
 
 from dotenv import load_dotenv
-from flask import Flask, Response, abort, redirect, render_template, request, send_file
+from flask import Flask, Response, abort, redirect, request, send_file
 from flask_compress import Compress
+from markupsafe import Markup, escape
+from werkzeug.wsgi import FileWrapper
 
 from utils.translation import load_translation
 
 load_dotenv(".env")
 
+
+def _envbool(key: str, default: bool = False) -> bool:
+    """
+    Read a boolean environment variable.
+
+    Args:
+        key (str): Environment variable name.
+        default (bool): Value used when the variable is unset or empty.
+
+    Returns:
+        bool: True for '1', 'true', 'yes' or 'on' (case-insensitive), otherwise False.
+    """
+    value = os.getenv(key)
+    if not value:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+SAFE_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "downloads")
+SAFE_ROOT_WITH_SEP = SAFE_ROOT + os.sep
+
+FONT_FAMILY = os.getenv("FONT_FAMILY")
+FAVICON = os.getenv("FAVICON")
+THEME_COLOR = os.getenv("THEME_COLOR")
+IGNORE_FILES = frozenset(filter(None, os.getenv("IGNORE_FILES", "").split(",")))
+
 app = Flask(__name__, static_folder="assets")
-app.add_url_rule(
-    "/favicon.ico",
-    endpoint="favicon",
-    redirect_to=os.getenv("favicon"),
+app.config["USE_X_SENDFILE"] = _envbool("USE_X_SENDFILE")
+app.config["COMPRESS_REGISTER"] = False
+compress = Compress(app)
+_index_template = app.jinja_env.get_template("index.min.html")
+with open(os.path.join(app.static_folder, "css", "style.min.css"), "rb") as f:
+    _style_version = hashlib.md5(f.read(), usedforsecurity=False).hexdigest()[:8]
+
+FAVICON_MAX_AGE = 86400
+ASSET_MAX_AGE = 31536000
+DOWNLOAD_BUFFER_SIZE = 1 << 20
+LISTING_CACHE_SIZE = max(0, int(os.getenv("LISTING_CACHE_SIZE") or 128))
+LISTING_CACHE_TTL = max(0.0, float(os.getenv("LISTING_CACHE_TTL") or 60))
+_listing_cache: OrderedDict[
+    tuple[str, str], tuple[int, float, Markup, list[tuple[str, str]]]
+] = OrderedDict()
+_listing_lock = threading.Lock()
+
+_ICON_BY_TYPE: dict[str, str] = {
+    "application/pdf": "fas fa-file-pdf",
+    "application/msword": "fas fa-file-word",
+    "application/vnd.ms-excel": "fas fa-file-excel",
+    "application/vnd.ms-powerpoint": "fas fa-file-powerpoint",
+    "application/zip": "fas fa-file-archive",
+    "application/x-rar-compressed": "fas fa-file-archive",
+    "text/html": "fab fa-html5",
+    "text/css": "fab fa-css3",
+    "application/json": "fas fa-file-code",
+    "application/javascript": "fab fa-js",
+    "text/plain": "fas fa-file-alt",
+}
+_ICON_BY_MAIN_TYPE: dict[str, str] = {
+    "video": "fas fa-video",
+    "image": "fas fa-image",
+    "audio": "fas fa-music",
+    "text": "fas fa-file-alt",
+}
+mimetypes.init()
+_MIME_BY_EXTENSION: dict[str, str] = dict(mimetypes.types_map)
+_ICON_BY_EXTENSION: dict[str, str] = {
+    ext: _ICON_BY_TYPE.get(mime_type)
+    or _ICON_BY_MAIN_TYPE.get(mime_type.split("/", 1)[0], "fas fa-file")
+    for ext, mime_type in _MIME_BY_EXTENSION.items()
+}
+_ICON_BY_EXTENSION.update(
+    {
+        ".docx": "fas fa-file-word",
+        ".xlsx": "fas fa-file-excel",
+        ".pptx": "fas fa-file-powerpoint",
+        ".rar": "fas fa-file-archive",
+        ".7z": "fas fa-file-archive",
+        ".js": "fab fa-js",
+        ".py": "fab fa-python",
+    }
 )
-Compress(app)
+
+_UTC = datetime.timezone.utc
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+_SIZE_DIVISORS = (1, 1 << 10, 1 << 20, 1 << 30, 1 << 40)
+
+_LANG_RE = re.compile(r"^([a-z]{2})\.yml$", re.IGNORECASE)
+_valid_languages_cache: Optional[tuple[int, frozenset[str]]] = None
+
+
+@functools.lru_cache(maxsize=1024)
+def _guess_mime_type(suffix: str) -> str:
+    """
+    Guess the MIME type of a file whose extension is not in _MIME_BY_EXTENSION.
+
+    Args:
+        suffix (str): Lowercased last one or two file suffixes (e.g., '.tar.gz').
+
+    Returns:
+        str: Guessed MIME type, or 'application/octet-stream' if unknown.
+    """
+    return mimetypes.guess_type(f"file{suffix}")[0] or "application/octet-stream"
+
+
+def _valid_languages() -> frozenset[str]:
+    """
+    Return the language codes that have a translation file.
+
+    The result is cached and only rebuilt when the 'languages' directory changes.
+
+    Returns:
+        frozenset[str]: Available two-letter language codes.
+    """
+    global _valid_languages_cache
+    mtime = os.stat("languages").st_mtime_ns
+    if _valid_languages_cache is not None and _valid_languages_cache[0] == mtime:
+        return _valid_languages_cache[1]
+    codes = frozenset(
+        match.group(1) for f in os.listdir("languages") if (match := _LANG_RE.match(f))
+    )
+    _valid_languages_cache = (mtime, codes)
+    return codes
 
 
 @app.route("/", methods=["GET"])
-async def redirect_to_default_lang() -> Response:
+def redirect_to_default_lang() -> Response:
     """
     Redirect to the default language '/en' preserving query string if any.
 
@@ -33,105 +157,201 @@ async def redirect_to_default_lang() -> Response:
     return redirect(url, code=302)
 
 
-@app.route("/<lang_code>", methods=["GET"])
-async def index(lang_code: str) -> Union[str, Response]:
+def _render_row(icon: str, name: str, link: str, size: str = "", date: str = "") -> str:
     """
-    Render directory listing page for the given language.
+    Render one listing table row, escaping the name and link.
 
-    Validates the language, loads translation, lists directory contents, and renders page.
+    Args:
+        icon (str): Font Awesome icon classes.
+        name (str): Displayed entry name.
+        link (str): Entry URL.
+        size (str): Human-readable size, empty for folders.
+        date (str): ISO 8601 modification time, empty for folders.
+
+    Returns:
+        str: A single <tr> element.
+    """
+    return (
+        f'<tr><td class="icon"><i class="{icon}"></i></td>'
+        f'<td><a href="{escape(link)}">{escape(name)}</a></td>'
+        f"<td>{size}</td>"
+        f'<td><time class="local-time" datetime="{date}">{date}</time></td></tr>'
+    )
+
+
+def _build_listing(
+    directory: str, lang_code: str, languages: dict[str, Any]
+) -> tuple[Markup, list[tuple[str, str]]]:
+    """
+    Build the directory listing table rows straight from a scandir pass.
 
     Args:
-        lang_code (str): Two-letter language code.
+        directory (str): Absolute path of the directory being listed.
+        lang_code (str): Two-letter language code used in folder links.
+        languages (dict[str, Any]): Loaded translation data.
 
     Returns:
-        Any: Rendered HTML or error response.
+        tuple[Markup, list[tuple[str, str]]]: The concatenated <tr> elements and the
+        (name, link) pair of every row, parent directory first.
     """
-    valid_languages = {
-        f[:-4]
-        for f in os.listdir("languages")
-        if f.endswith(".yml") and len(f) == 6 and f[:-4].isalpha()
-    }
-    if lang_code not in valid_languages:
-        return await download_file(lang_code)
-    languages = await load_translation(lang_code)
-    safe_root = os.path.join(os.path.dirname(__file__), "downloads")
-    directory = os.path.normpath(os.path.join(safe_root, request.args.get("dir", "")))
-    if not directory.startswith(safe_root) or not os.path.isdir(directory):
-        return abort(404)
-    file_list = []
-    if directory != safe_root:
+    rows = []
+    links = []
+    if directory != SAFE_ROOT:
         parent_dir = os.path.dirname(directory)
         link = (
             f"/{lang_code}"
-            if parent_dir == safe_root
-            else f"/{lang_code}?dir={os.path.relpath(parent_dir, safe_root)}"
-        )
-        file_list.append(
-            {
-                "icon": "fas fa-level-up-alt",
-                "name": languages["Parent_Directory"],
-                "link": link,
-            }
+            if parent_dir == SAFE_ROOT
+            else f"/{lang_code}?dir={os.path.relpath(parent_dir, SAFE_ROOT)}"
         )
-    ignore_files = set(os.getenv("IGNORE_FILES", "").split(","))
-    for name in sorted(
-        f
-        for f in os.listdir(directory)
-        if not f.startswith(".") and f not in ignore_files
-    ):
-        file_path = os.path.join(directory, name)
-        if os.path.isfile(file_path):
-            mime_type, _ = mimetypes.guess_type(file_path)
-            main_type = mime_type.split("/")[0] if mime_type else ""
-            icon_map = {
-                "video": "fas fa-video",
-                "image": "fas fa-image",
-                "audio": "fas fa-music",
-                "application/pdf": "fas fa-file-pdf",
-                "application/msword": "fas fa-file-word",
-                "application/vnd.ms-excel": "fas fa-file-excel",
-                "application/vnd.ms-powerpoint": "fas fa-file-powerpoint",
-                "application/zip": "fas fa-file-archive",
-                "application/x-rar-compressed": "fas fa-file-archive",
-                "text/html": "fab fa-html5",
-                "text/css": "fab fa-css3",
-                "application/json": "fas fa-file-code",
-                "application/javascript": "fab fa-js",
-                "text/plain": "fas fa-file-alt",
-            }
-            icon = icon_map.get(mime_type, icon_map.get(main_type, "fas fa-file"))
-            size_bytes = os.path.getsize(file_path)
-            idx = min(4, max(0, (size_bytes.bit_length() - 1) // 10))
-            size_units = ["B", "KB", "MB", "GB", "TB"]
-            size = size_bytes / (1024**idx)
-            file_list.append(
-                {
-                    "icon": icon,
-                    "name": name,
-                    "link": f"/{os.path.relpath(file_path, safe_root)}",
-                    "size": f"{size:.2f}{size_units[idx]}",
-                    "date": datetime.datetime.fromtimestamp(
-                        os.path.getmtime(file_path), tz=datetime.timezone.utc
-                    ).strftime("%Y-%m-%dT%H:%M:%S+00:00"),
-                }
+        name = languages["Parent_Directory"]
+        rows.append(_render_row("fas fa-level-up-alt", name, link))
+        links.append((name, link))
+    entries = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            name = entry.name
+            if name.startswith(".") or name in IGNORE_FILES:
+                continue
+            try:
+                if entry.is_file():
+                    st = entry.stat()
+                elif entry.is_dir():
+                    st = None
+                else:
+                    continue
+            except OSError:
+                continue
+            entries.append((st is not None, name.lower(), name, st))
+    entries.sort(key=lambda e: e[:3])
+    rel_prefix = (
+        "" if directory == SAFE_ROOT else f"{os.path.relpath(directory, SAFE_ROOT)}/"
+    )
+    for _, _, name, st in entries:
+        if st is not None:
+            link = f"/{rel_prefix}{name}"
+            size_bytes = st.st_size
+            bit_length = size_bytes.bit_length()
+            idx = 0 if bit_length <= 10 else min(4, (bit_length - 1) // 10)
+            rows.append(
+                _render_row(
+                    _ICON_BY_EXTENSION.get(
+                        os.path.splitext(name)[1].lower(), "fas fa-file"
+                    ),
+                    name,
+                    link,
+                    f"{size_bytes / _SIZE_DIVISORS[idx]:.2f}{_SIZE_UNITS[idx]}",
+                    datetime.datetime.fromtimestamp(st.st_mtime, _UTC).isoformat(
+                        timespec="seconds"
+                    ),
+                )
             )
         else:
-            file_list.append(
-                {
-                    "icon": "fas fa-folder-open",
-                    "name": name,
-                    "link": f"/{lang_code}?dir={os.path.relpath(file_path, safe_root)}",
-                }
+            link = f"/{lang_code}?dir={rel_prefix}{name}"
+            rows.append(_render_row("fas fa-folder-open", name, link))
+        links.append((name, link))
+    return Markup("".join(rows)), links
+
+
+def _render_list_items(links: list[tuple[str, str]], url_root: str) -> Markup:
+    """
+    Render the schema.org ListItem objects for the page's JSON-LD block.
+
+    Args:
+        links (list[tuple[str, str]]): (name, link) pairs built by _build_listing.
+        url_root (str): Site root URL without a trailing slash.
+
+    Returns:
+        Markup: Comma-separated ListItem objects.
+    """
+    return Markup(
+        ",".join(
+            f'{{"@type": "ListItem", "position": {position}, '
+            f'"name": "{escape(name)}", '
+            f'"url": "{escape(url_root + link)}"}}'
+            for position, (name, link) in enumerate(links, 1)
+        )
+    )
+
+
+@app.route("/<lang_code>", methods=["GET"])
+def index(lang_code: str) -> Union[str, Response]:
+    """
+    Render directory listing page for the given language.
+
+    Validates the language, loads translation, lists directory contents, and renders page.
+
+    Args:
+        lang_code (str): Two-letter language code.
+
+    Returns:
+        Any: Rendered HTML or error response.
+    """
+    if lang_code not in _valid_languages():
+        return download_file(lang_code)
+    languages = load_translation(lang_code)
+    directory = os.path.normpath(os.path.join(SAFE_ROOT, request.args.get("dir", "")))
+    if not (
+        directory == SAFE_ROOT or directory.startswith(SAFE_ROOT_WITH_SEP)
+    ) or not os.path.isdir(directory):
+        return abort(404)
+    dir_mtime = os.stat(directory).st_mtime_ns
+    cache_key = (directory, lang_code)
+    cached = None
+    with _listing_lock:
+        entry = _listing_cache.get(cache_key)
+        if (
+            entry is not None
+            and entry[0] == dir_mtime
+            and time.monotonic() - entry[1] < LISTING_CACHE_TTL
+        ):
+            _listing_cache.move_to_end(cache_key)
+            cached = entry
+    if cached is None:
+        try:
+            cached = (
+                dir_mtime,
+                time.monotonic(),
+                *_build_listing(directory, lang_code, languages),
             )
-    return render_template(
-        "index.min.html",
-        file_list=file_list,
+        except PermissionError:
+            return abort(403)
+        with _listing_lock:
+            _listing_cache[cache_key] = cached
+            _listing_cache.move_to_end(cache_key)
+            while len(_listing_cache) > LISTING_CACHE_SIZE:
+                _listing_cache.popitem(last=False)
+    _, _, rows, links = cached
+    page = _index_template.generate(
+        request=request._get_current_object(),
+        rows=rows,
+        list_items=_render_list_items(links, request.url_root.rstrip("/")),
         lang=lang_code,
         languages=languages,
-        font_family=os.getenv("FONT_FAMILY"),
-        favicon=os.getenv("FAVICON"),
-        theme_color=os.getenv("THEME_COLOR"),
+        font_family=FONT_FAMILY,
+        style_version=_style_version,
+        favicon=FAVICON,
+        theme_color=THEME_COLOR,
     )
+    return Response(page, mimetype="text/html")
+
+
+@app.route("/favicon.ico", methods=["GET"])
+def favicon() -> Response:
+    """
+    Redirect to the configured favicon with a cacheable permanent redirect.
+
+    Returns:
+        Response: Redirect response (301) to the FAVICON URL.
+
+    Raises:
+        404: If no favicon is configured.
+    """
+    if not FAVICON:
+        return abort(404)
+    response = redirect(FAVICON, code=301)
+    response.cache_control.public = True
+    response.cache_control.max_age = FAVICON_MAX_AGE
+    return response
 
 
 @app.route("/LICENSE", methods=["GET"])
@@ -149,7 +369,7 @@ def show_license() -> Response:
 
 
 @app.route("/<path:filename>", methods=["GET"])
-async def download_file(filename: str) -> Union[Response, Any]:
+def download_file(filename: str) -> Union[Response, Any]:
     """
     Serve a file securely for download or inline display based on MIME type.
 
@@ -159,21 +379,71 @@ async def download_file(filename: str) -> Union[Response, Any]:
     Returns:
         Response: Flask response serving the file or aborts if access denied.
     """
-    safe_root: str = os.path.join(os.path.dirname(__file__), "downloads")
-    file_path: str = os.path.normpath(os.path.join(safe_root, filename))
-    if not file_path.startswith(safe_root):
+    parts = filename.split("/")
+    file_path: str = os.path.join(SAFE_ROOT, filename)
+    if "\\" in filename or "\x00" in filename or any(
+        part in ("", ".", "..") for part in parts
+    ):
+        file_path = os.path.normpath(file_path)
+    if not file_path.startswith(SAFE_ROOT_WITH_SEP):
         return abort(403)
-    ignore_files = set(os.getenv("ignore_files", "").split(","))
-    for part in filename.split("/"):
-        if part in ignore_files:
+    for part in parts:
+        if part in IGNORE_FILES:
             return abort(403)
     if os.path.isfile(file_path):
-        return send_file(file_path, as_attachment=True)
+        name = os.path.basename(file_path)
+        mime_type = _MIME_BY_EXTENSION.get(
+            os.path.splitext(name)[1].lower()
+        ) or _guess_mime_type("".join(PurePath(name).suffixes[-2:]).lower())
+        response = send_file(file_path, mimetype=mime_type, as_attachment=True)
+        if isinstance(response.response, FileWrapper):
+            response.response.buffer_size = DOWNLOAD_BUFFER_SIZE
+        return response
     return abort(404)
 
 
+@app.after_request
+def compress_response(response: Response) -> Response:
+    """
+    Compress the response unless its body is delegated to the front-end server.
+
+    Args:
+        response (Response): Outgoing response.
+
+    Returns:
+        Response: The compressed response, or the original one for X-Sendfile.
+    """
+    if "X-Sendfile" in response.headers:
+        return response
+    return compress.after_request(response)
+
+
+@app.after_request
+def cache_versioned_assets(response: Response) -> Response:
+    """
+    Mark versioned static assets as immutable so browsers cache them long-term.
+
+    Args:
+        response (Response): Outgoing response.
+
+    Returns:
+        Response: The same response, with Cache-Control set for successful
+        '/assets/...?v=' requests that carry the current asset version.
+    """
+    if (
+        response.status_code == 200
+        and request.path.startswith("/assets/")
+        and request.args.get("v") == _style_version
+    ):
+        response.cache_control.no_cache = None
+        response.cache_control.public = True
+        response.cache_control.max_age = ASSET_MAX_AGE
+        response.cache_control.immutable = True
+    return response
+
+
 @app.errorhandler(Exception)
-async def handle_error(error: Exception) -> Any:
+def handle_error(error: Exception) -> Any:
     """
     Handle exceptions and redirect to a custom error page based on HTTP status code.
 
@@ -197,12 +467,15 @@ async def handle_error(error: Exception) -> Any:
 
 
 if __name__ == "__main__":
+    use_reloader = _envbool("USE_RELOADER")
     app.run(
         host=os.getenv("HOST"),
-        port=os.getenv("PORT"),
-        use_reloader=os.getenv("USE_RELOADER"),
-        debug=os.getenv("DEBUG"),
-        extra_files=glob.glob(
-            os.path.join(os.path.dirname(os.path.abspath(__file__)), "*")
+        port=int(os.getenv("PORT") or 5000),
+        use_reloader=use_reloader,
+        debug=_envbool("DEBUG"),
+        extra_files=(
+            glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), "*"))
+            if use_reloader
+            else None
         ),
     )
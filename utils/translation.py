@@ -1,13 +1,20 @@
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 import yaml
 
+BASE_PATH = os.path.abspath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "languages")
+)
+_translations: Dict[str, Tuple[int, Dict[str, Any]]] = {}
 
-async def load_translation(language: str) -> Dict[str, Any]:
+
+def load_translation(language: str) -> Dict[str, Any]:
     """
     Load the translation file for the given language.
 
+    Parsed translations are cached in memory and reloaded only when the file changes.
+
     Args:
         language (str): Language code (e.g., 'en').
 
@@ -18,13 +25,19 @@ async def load_translation(language: str) -> Dict[str, Any]:
         ValueError: If the file path is invalid.
         FileNotFoundError: If the translation file does not exist.
     """
-    base_path = os.path.abspath(
-        os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "languages")
-    )
-    file_path = os.path.abspath(os.path.join(base_path, f"{language}.yml"))
-    if not file_path.startswith(base_path):
+    file_path = os.path.abspath(os.path.join(BASE_PATH, f"{language}.yml"))
+    if not file_path.startswith(BASE_PATH):
         raise ValueError("Invalid translation file path")
-    if os.path.exists(file_path):
-        with open(file_path, encoding="utf-8") as f:
-            return yaml.safe_load(f)
-    raise FileNotFoundError(f"Translation file not found: languages/{language}.yml")
+    try:
+        mtime = os.stat(file_path).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"Translation file not found: languages/{language}.yml"
+        ) from None
+    cached = _translations.get(language)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with open(file_path, "rb", buffering=0) as f:
+        data = yaml.safe_load(f.read())
+    _translations[language] = (mtime, data)
+    return data